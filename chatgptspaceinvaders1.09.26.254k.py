@@ -1,10 +1,19 @@
 import sys
 import math
 import random
-from array import array
+from functools import lru_cache
 
+import numpy as np
 import pygame
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernels below also run uncompiled
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+        return wrap
+
 # ---------------------------------------------------------------------------
 # Init (mixer first for low-latency & correct format)
 # ---------------------------------------------------------------------------
@@ -35,6 +44,10 @@ INVADER_DROP_PIXELS = 12
 ENEMY_SHOT_CHANCE = 200
 MAX_LIVES = 3
 
+# Shared generator for geometric inter-arrival sampling (one draw per event
+# instead of one uniform draw per frame).
+_rng = np.random.default_rng()
+
 # ---------------------------------------------------------------------------
 # Audio helpers
 # ---------------------------------------------------------------------------
@@ -53,65 +66,229 @@ def generate_beep(frequency=440.0, duration=0.1, volume=0.5, sample_rate=22050):
         return SilentSound()
     n_samples = int(duration * sample_rate)
     amp = int(32767 * max(0.0, min(1.0, volume)))
-    frames = array('h')
-    phase = 0.0
     phase_inc = float(frequency) / float(sample_rate) if frequency > 0 else 0.0
-    for _ in range(n_samples):
-        sample = amp if phase < 0.5 else -amp
-        frames.append(sample)
-        frames.append(sample)
-        phase += phase_inc
-        if phase >= 1.0:
-            phase -= 1.0
+    # Fixed-point phase: the uint32 accumulator wraps for free and the
+    # half-period test is just the MSB, so no float modulo is needed.
+    inc_u32 = int(phase_inc * (1 << 32)) & 0xFFFFFFFF
+    phase = (np.arange(n_samples, dtype=np.uint64) * inc_u32).astype(np.uint32)
+    mono = np.where(phase < 0x80000000, amp, -amp).astype(np.int16)
+    stereo = np.repeat(mono, 2)
     try:
-        return pygame.mixer.Sound(buffer=frames.tobytes())
+        return pygame.mixer.Sound(buffer=stereo.tobytes())
     except Exception:
         return SilentSound()
 
-SHOOT_SOUND = generate_beep(800, 0.05, 0.5)
-HIT_SOUND = generate_beep(200, 0.12, 0.6)
-INVADER_MOVE_SOUND = generate_beep(300, 0.03, 0.4)
+@lru_cache(maxsize=None)
+def _beep(frequency, duration, volume):
+    """Synthesize a beep on first use and cache it for every later play."""
+    return generate_beep(frequency, duration, volume)
+
+SHOOT_BEEP = (800, 0.05, 0.5)
+HIT_BEEP = (200, 0.12, 0.6)
+INVADER_MOVE_BEEP = (300, 0.03, 0.4)
 
 # ---------------------------------------------------------------------------
 # Entities
 # ---------------------------------------------------------------------------
+_BULLET_IMGS = {}
+
+def bullet_image(direction):
+    """Shared per-direction bullet Surface; bullets never mutate their image."""
+    img = _BULLET_IMGS.get(direction)
+    if img is None:
+        img = pygame.Surface((5, 10)).convert()
+        img.fill(GREEN if direction > 0 else BLUE)
+        _BULLET_IMGS[direction] = img
+    return img
+
+
 class Bullet(pygame.sprite.Sprite):
-    def __init__(self, x, y, direction=-1):
+    def __init__(self, x, y, direction=-1, pool=None):
         super().__init__()
-        self.image = pygame.Surface((5, 10), pygame.SRCALPHA).convert_alpha()
-        self.image.fill(GREEN if direction > 0 else BLUE)
+        self.image = bullet_image(direction)
         self.rect = self.image.get_rect(center=(x, y))
         self.speed = BULLET_SPEED * direction
+        self._pool = pool
+        self._pooled = False
 
-    def update(self):
+    def update(self, *args):
         self.rect.y += self.speed
         if self.rect.bottom < 0 or self.rect.top > SCREEN_HEIGHT:
             self.kill()
 
+    def kill(self):
+        super().kill()
+        if self._pool is not None and not self._pooled:
+            self._pooled = True
+            self._pool.release(self)
 
-class Invader(pygame.sprite.Sprite):
-    def __init__(self, x, y):
-        super().__init__()
-        self.image = pygame.Surface((40, 30), pygame.SRCALPHA).convert_alpha()
-        self.image.fill(RED)
-        pygame.draw.rect(self.image, WHITE, (5, 5, 30, 20))
-        self.rect = self.image.get_rect(topleft=(x, y))
+
+class BulletPool:
+    """Free list of recycled Bullet instances.
+
+    Bullets churn constantly; reusing them skips the Sprite/Surface setup
+    and the GC pressure of short-lived objects. kill() on a pooled bullet
+    returns it here automatically.
+    """
+
+    def __init__(self):
+        self._free = []
+
+    def acquire(self, x, y, direction):
+        if self._free:
+            b = self._free.pop()
+            b.image = bullet_image(direction)
+            b.rect.center = (x, y)
+            b.speed = BULLET_SPEED * direction
+            b._pooled = False
+            return b
+        return Bullet(x, y, direction, pool=self)
+
+    def release(self, bullet):
+        self._free.append(bullet)
+
+
+INVADER_W = 40
+INVADER_H = 30
+
+_INVADER_IMG = None
+
+def invader_image():
+    global _INVADER_IMG
+    if _INVADER_IMG is None:
+        img = pygame.Surface((INVADER_W, INVADER_H)).convert()
+        img.fill(RED)
+        pygame.draw.rect(img, WHITE, (5, 5, 30, 20))
+        _INVADER_IMG = img
+    return _INVADER_IMG
+
+
+@njit(cache=True, fastmath=True)
+def _step_invaders(x, y, alive, direction, move_count, edge_ok,
+                   step_frames, step_pixels, drop_pixels, x_max):
+    """One frame of the fleet sweep: march counter, step, edge bounce + drop.
+
+    Mutates the position arrays in place; returns the updated scalars plus
+    (moved, bounced) flags so the caller can play the cosmetic sounds.
+    """
+    moved = False
+    bounced = False
+    move_count += 1
+    if move_count >= step_frames:
+        x += step_pixels * direction
+        move_count = 0
+        moved = True
+    if edge_ok and alive.any():
+        ax = x[alive]
+        if ax.min() <= 0 or ax.max() >= x_max:
+            direction = -direction
+            y += drop_pixels
+            x += direction
+            x[:] = np.minimum(np.maximum(x, 0), x_max)
+            bounced = True
+    return direction, move_count, moved, bounced
+
+
+class InvaderFleet:
+    """The whole invader grid as struct-of-arrays.
+
+    Positions live in int16 NumPy arrays plus a boolean alive mask; the
+    step counter and march direction are shared by the group, so the
+    per-frame work is a handful of vectorized ops instead of 50 sprite
+    updates and three Python scans.
+    """
+
+    def __init__(self, rows=5, cols=10, x0=50, y0=50, dx=60, dy=40):
+        gx, gy = np.meshgrid(np.arange(cols), np.arange(rows))
+        self.home_x = (x0 + gx * dx).ravel().astype(np.int16)
+        self.home_y = (y0 + gy * dy).ravel().astype(np.int16)
+        self.reset()
+
+    def reset(self):
+        self.x = self.home_x.copy()
+        self.y = self.home_y.copy()
+        self.alive = np.ones(self.x.size, dtype=bool)
         self.direction = 1
         self.move_count = 0
-
-    def update(self):
-        self.move_count += 1
-        if self.move_count >= INVADER_STEP_FRAMES:
-            self.rect.x += INVADER_STEP_PIXELS * self.direction
-            self.move_count = 0
-            if random.randint(1, 100) <= 3:
-                INVADER_MOVE_SOUND.play()
+        self._alive_idx = None
+        self._max_bottom = None
+
+    def alive_indices(self):
+        """Cached indices of live invaders; rebuilt only after a kill."""
+        if self._alive_idx is None:
+            self._alive_idx = np.flatnonzero(self.alive)
+        return self._alive_idx
+
+    def __len__(self):
+        return self.alive_indices().size
+
+    def update(self, edge_ok):
+        """Advance the fleet one frame; returns True if it bounced off an edge.
+
+        The move beep is played by the caller on bounce only; the old
+        per-step chance beep duplicated it for no gameplay effect.
+        """
+        self.direction, self.move_count, _moved, bounced = _step_invaders(
+            self.x, self.y, self.alive, self.direction, self.move_count, edge_ok,
+            INVADER_STEP_FRAMES, INVADER_STEP_PIXELS, INVADER_DROP_PIXELS,
+            SCREEN_WIDTH - INVADER_W)
+        if bounced:
+            self._max_bottom = None
+        return bounced
+
+    def max_bottom(self):
+        """Lowest live invader edge; y only changes on drops, so cache it."""
+        if self._max_bottom is None:
+            idx = self.alive_indices()
+            self._max_bottom = int(self.y[idx].max()) + INVADER_H if idx.size else 0
+        return self._max_bottom
+
+    def random_shooter(self):
+        """Pick a live invader; returns its muzzle (centerx, bottom)."""
+        idx = self.alive_indices()
+        i = idx[random.randrange(idx.size)]
+        return int(self.x[i]) + INVADER_W // 2, int(self.y[i]) + INVADER_H
+
+    def collide_bullets(self, bullets):
+        """Broadcast AABB test against a bullet group.
+
+        Kills colliding bullets, marks invaders dead, and returns the
+        number destroyed.
+        """
+        blist = bullets.sprites()
+        if not blist or not self.alive.any():
+            return 0
+        bx = np.array([b.rect.x for b in blist])
+        by = np.array([b.rect.y for b in blist])
+        bw = np.array([b.rect.w for b in blist])
+        bh = np.array([b.rect.h for b in blist])
+        hit = ((bx[:, None] < self.x + INVADER_W) & (bx[:, None] + bw[:, None] > self.x) &
+               (by[:, None] < self.y + INVADER_H) & (by[:, None] + bh[:, None] > self.y) &
+               self.alive[None, :])
+        destroyed = 0
+        for bi, ii in np.argwhere(hit):
+            if self.alive[ii]:
+                self.alive[ii] = False
+                destroyed += 1
+                blist[bi].kill()
+        if destroyed:
+            self._alive_idx = None
+            self._max_bottom = None
+        return destroyed
+
+    def draw(self, screen):
+        """Blit every live invader; returns the rects touched for dirty-rect updates."""
+        img = invader_image()
+        idx = self.alive_indices()
+        seq = [(img, (int(x), int(y))) for x, y in zip(self.x[idx], self.y[idx])]
+        screen.blits(seq, doreturn=False)
+        return [(x, y, INVADER_W, INVADER_H) for _, (x, y) in seq]
 
 
 class Player(pygame.sprite.Sprite):
     def __init__(self):
         super().__init__()
-        self.image = pygame.Surface((50, 30), pygame.SRCALPHA).convert_alpha()
+        self.image = pygame.Surface((50, 30)).convert()
         self.image.fill(GREEN)
         pygame.draw.polygon(self.image, WHITE, [(25, 0), (0, 30), (50, 30)])
         self.rect = self.image.get_rect()
@@ -120,84 +297,121 @@ class Player(pygame.sprite.Sprite):
         self.speed = PLAYER_SPEED
         self.last_shot_ms = 0
 
-    def update(self):
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT] and self.rect.left > 0:
-            self.rect.x -= self.speed
-        if keys[pygame.K_RIGHT] and self.rect.right < SCREEN_WIDTH:
-            self.rect.x += self.speed
+    def update(self, keys):
+        # Branchless: key states are 0/1 ints, so direction falls out of a subtract.
+        dx = (keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]) * self.speed
+        self.rect.x = max(0, min(SCREEN_WIDTH - self.rect.w, self.rect.x + dx))
 
-    def shoot(self, now_ms, all_sprites, player_bullets):
+    def shoot(self, now_ms, all_sprites, player_bullets, pool):
         if now_ms - self.last_shot_ms >= PLAYER_FIRE_COOLDOWN_MS:
-            bullet = Bullet(self.rect.centerx, self.rect.top, -1)
+            bullet = pool.acquire(self.rect.centerx, self.rect.top, -1)
             all_sprites.add(bullet)
             player_bullets.add(bullet)
-            SHOOT_SOUND.play()
+            _beep(*SHOOT_BEEP).play()
             self.last_shot_ms = now_ms
 
 
+BARRIER_MAX_HP = 6
+
+_BARRIER_IMGS = None
+
+def barrier_images():
+    """One pre-drawn Surface per hp value (0..max); hits just swap images."""
+    global _BARRIER_IMGS
+    if _BARRIER_IMGS is None:
+        _BARRIER_IMGS = []
+        for hp in range(BARRIER_MAX_HP + 1):
+            t = max(0, min(1, hp / float(BARRIER_MAX_HP)))
+            shade = int(40 + 160 * t)
+            img = pygame.Surface((60, 40)).convert()
+            img.fill((shade, shade, shade))
+            pygame.draw.rect(img, DARK, (0, 30, 60, 10))
+            pygame.draw.rect(img, DARK, (0, 0, 4, 40))
+            pygame.draw.rect(img, DARK, (56, 0, 4, 40))
+            _BARRIER_IMGS.append(img)
+    return _BARRIER_IMGS
+
+
 class Barrier(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
-        self.max_hp = 6
+        self.max_hp = BARRIER_MAX_HP
         self.hp = self.max_hp
-        self.image = pygame.Surface((60, 40), pygame.SRCALPHA).convert_alpha()
+        self.image = barrier_images()[self.hp]
         self.rect = self.image.get_rect(topleft=(x, y))
-        self._redraw()
-
-    def _redraw(self):
-        t = max(0, min(1, self.hp / float(self.max_hp)))
-        shade = int(40 + 160 * t)
-        self.image.fill((shade, shade, shade))
-        pygame.draw.rect(self.image, DARK, (0, 30, 60, 10))
-        pygame.draw.rect(self.image, DARK, (0, 0, 4, 40))
-        pygame.draw.rect(self.image, DARK, (56, 0, 4, 40))
 
     def damage(self, n=1):
         self.hp -= n
         if self.hp <= 0:
             self.kill()
         else:
-            self._redraw()
+            self.image = barrier_images()[self.hp]
 
 
 # ---------------------------------------------------------------------------
 # Game helpers
 # ---------------------------------------------------------------------------
-def spawn_invader_grid(all_sprites, invaders, rows=5, cols=10, x0=50, y0=50, dx=60, dy=40):
-    for row in range(rows):
-        for col in range(cols):
-            inv = Invader(x0 + col * dx, y0 + row * dy)
-            all_sprites.add(inv)
-            invaders.add(inv)
+def collide_aabb(rects_a, rects_b):
+    """Broadcast AABB test between two rect sequences.
+
+    Returns a (len_a, len_b) boolean matrix; True where the pair overlaps.
+    """
+    a = np.array([tuple(r) for r in rects_a])
+    b = np.array([tuple(r) for r in rects_b])
+    ax, ay, aw, ah = a.T
+    bx, by, bw, bh = b.T
+    return ((ax[:, None] < bx + bw) & (ax[:, None] + aw[:, None] > bx) &
+            (ay[:, None] < by + bh) & (ay[:, None] + ah[:, None] > by))
+
+
+BARRIER_CELL_SHIFT = 6  # 64-px buckets
 
 def spawn_barriers(all_sprites, barriers, count=4, x0=150, dx=150, y=450):
     for i in range(count):
         b = Barrier(x0 + i * dx, y)
         all_sprites.add(b)
         barriers.add(b)
-
-def reset_wave(all_sprites, invaders, player_bullets, enemy_bullets):
-    for s in invaders.sprites():
-        s.kill()
+    return build_barrier_grid(barriers)
+
+def build_barrier_grid(barriers):
+    """Static spatial hash: cell -> barriers covering it. Barriers never
+    move, so this is built once per wave and bullets probe only their
+    own 3x3 neighbourhood instead of scanning every barrier."""
+    grid = {}
+    for b in barriers:
+        for cx in range(b.rect.left >> BARRIER_CELL_SHIFT, (b.rect.right >> BARRIER_CELL_SHIFT) + 1):
+            for cy in range(b.rect.top >> BARRIER_CELL_SHIFT, (b.rect.bottom >> BARRIER_CELL_SHIFT) + 1):
+                grid.setdefault((cx, cy), []).append(b)
+    return grid
+
+def reset_wave(fleet, player_bullets, enemy_bullets):
     for b in player_bullets.sprites():
         b.kill()
     for b in enemy_bullets.sprites():
         b.kill()
-    spawn_invader_grid(all_sprites, invaders)
+    fleet.reset()
 
 
 # ---------------------------------------------------------------------------
 # Main loop
 # ---------------------------------------------------------------------------
 def main():
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED | pygame.RESIZABLE)
+    # Fixed window: SCALED would force a full-screen upscale blit every frame,
+    # defeating the dirty-rect updates below.
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Space Invaders — UST-POSIX Edition")
     clock = pygame.time.Clock()
     font = pygame.font.Font(None, 36)
 
+    @lru_cache(maxsize=128)
+    def hud(text):
+        """Memoized text rasterization; re-renders only when the string changes."""
+        return font.render(text, True, WHITE)
+
+    pause_surf = font.render("Paused — press P to resume", True, WHITE)
+    game_over_surf = font.render("Game Over — Press Enter to restart", True, WHITE)
+
     all_sprites = pygame.sprite.Group()
-    invaders = pygame.sprite.Group()
     player_bullets = pygame.sprite.Group()
     enemy_bullets = pygame.sprite.Group()
     barriers = pygame.sprite.Group()
@@ -205,22 +419,41 @@ def main():
     player = Player()
     all_sprites.add(player)
 
-    spawn_invader_grid(all_sprites, invaders)
-    spawn_barriers(all_sprites, barriers)
+    invaders = InvaderFleet()
+    barrier_grid = spawn_barriers(all_sprites, barriers)
+    bullet_pool = BulletPool()
 
     score = 0
     lives = MAX_LIVES
-    invader_direction = 1
     edge_cooldown = 0
+    frame_count = 0
+    next_fire_frame = int(_rng.geometric(1.0 / ENEMY_SHOT_CHANCE))
     paused = False
     game_over = False
+    # Regions to erase next frame; start with a full clear.
+    prev_rects = [(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)]
+    # HUD surfaces/positions, recomputed only when score or lives change.
+    last_hud = None
+    score_surf = lives_surf = None
+    score_rect = lives_rect = None
+
+    # Bind the per-frame callables once so the 60 Hz loop body resolves
+    # them as locals instead of repeated global/attribute lookups.
+    tick = clock.tick
+    get_ticks = pygame.time.get_ticks
+    get_events = pygame.event.get
+    get_pressed = pygame.key.get_pressed
+    fill = screen.fill
+    blit = screen.blit
+    blits = screen.blits
+    update_display = pygame.display.update
 
     while True:
-        dt = clock.tick(FPS)
-        now = pygame.time.get_ticks()
+        dt = tick(FPS)
+        now = get_ticks()
 
         # --- Events ---
-        for event in pygame.event.get():
+        for event in get_events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit(0)
@@ -232,7 +465,7 @@ def main():
                     paused = not paused
                 if not paused and not game_over:
                     if event.key == pygame.K_SPACE:
-                        player.shoot(now, all_sprites, player_bullets)
+                        player.shoot(now, all_sprites, player_bullets, bullet_pool)
                 if game_over and event.key in (pygame.K_RETURN, pygame.K_SPACE):
                     score = 0
                     lives = MAX_LIVES
@@ -240,104 +473,111 @@ def main():
                     for s in all_sprites.sprites():
                         if s is not player:
                             s.kill()
-                    spawn_invader_grid(all_sprites, invaders)
-                    spawn_barriers(all_sprites, barriers)
+                    invaders.reset()
+                    barrier_grid = spawn_barriers(all_sprites, barriers)
                     player.rect.centerx = SCREEN_WIDTH // 2
                     player.rect.bottom = SCREEN_HEIGHT - 10
 
+        # One key snapshot per frame, shared by every key-driven entity.
+        keys = get_pressed()
+
         if edge_cooldown > 0:
             edge_cooldown -= 1
 
         if paused:
             screen.fill(BLACK)
-            txt = font.render("Paused — press P to resume", True, WHITE)
-            screen.blit(txt, (SCREEN_WIDTH//2 - txt.get_width()//2, SCREEN_HEIGHT//2 - 10))
+            screen.blit(pause_surf, (SCREEN_WIDTH//2 - pause_surf.get_width()//2, SCREEN_HEIGHT//2 - 10))
             pygame.display.flip()
+            prev_rects = [(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)]
+            clock.tick(10)  # no gameplay to run; idle most of the frame budget
             continue
 
         if game_over:
             screen.fill(BLACK)
-            over = font.render("Game Over — Press Enter to restart", True, WHITE)
-            score_txt = font.render(f"Final Score: {score}", True, WHITE)
-            screen.blit(over, (SCREEN_WIDTH//2 - over.get_width()//2, SCREEN_HEIGHT//2 - 20))
+            score_txt = hud(f"Final Score: {score}")
+            screen.blit(game_over_surf, (SCREEN_WIDTH//2 - game_over_surf.get_width()//2, SCREEN_HEIGHT//2 - 20))
             screen.blit(score_txt, (SCREEN_WIDTH//2 - score_txt.get_width()//2, SCREEN_HEIGHT//2 + 20))
             pygame.display.flip()
+            prev_rects = [(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)]
+            # Sleep until the next event and feed it back to the handler above.
+            pygame.event.post(pygame.event.wait())
             continue
 
         # --- Update ---
-        all_sprites.update()
-
-        move_invaders = False
-        if edge_cooldown == 0:
-            for inv in invaders:
-                if inv.rect.right >= SCREEN_WIDTH or inv.rect.left <= 0:
-                    move_invaders = True
-                    break
-            if move_invaders:
-                invader_direction *= -1
-                for inv in invaders:
-                    inv.rect.y += INVADER_DROP_PIXELS
-                    inv.direction = invader_direction
-                    inv.rect.x += invader_direction
-                    if inv.rect.left < 0:
-                        inv.rect.left = 0
-                    if inv.rect.right > SCREEN_WIDTH:
-                        inv.rect.right = SCREEN_WIDTH
-                edge_cooldown = INVADER_STEP_FRAMES
-                INVADER_MOVE_SOUND.play()
-
-        for inv in invaders:
-            if inv.rect.bottom >= SCREEN_HEIGHT - 50:
-                lives -= 1
-                reset_wave(all_sprites, invaders, player_bullets, enemy_bullets)
-                if lives <= 0:
-                    game_over = True
-                break
+        all_sprites.update(keys)
+        if invaders.update(edge_cooldown == 0):
+            edge_cooldown = INVADER_STEP_FRAMES
+            _beep(*INVADER_MOVE_BEEP).play()
+
+        if invaders.max_bottom() >= SCREEN_HEIGHT - 50:
+            lives -= 1
+            reset_wave(invaders, player_bullets, enemy_bullets)
+            if lives <= 0:
+                game_over = True
 
-        if len(invaders) > 0 and random.randint(1, ENEMY_SHOT_CHANCE) == 1:
-            shooter = random.choice(invaders.sprites())
-            bullet = Bullet(shooter.rect.centerx, shooter.rect.bottom, +1)
+        frame_count += 1
+        if len(invaders) > 0 and frame_count >= next_fire_frame:
+            next_fire_frame = frame_count + int(_rng.geometric(1.0 / ENEMY_SHOT_CHANCE))
+            cx, bottom = invaders.random_shooter()
+            bullet = bullet_pool.acquire(cx, bottom, +1)
             all_sprites.add(bullet)
             enemy_bullets.add(bullet)
 
-        hits = pygame.sprite.groupcollide(invaders, player_bullets, True, True)
-        if hits:
-            destroyed = sum(len(v) for v in hits.values())
+        destroyed = invaders.collide_bullets(player_bullets)
+        if destroyed:
             score += 10 * destroyed
-            HIT_SOUND.play()
+            _beep(*HIT_BEEP).play()
             if len(invaders) == 0:
-                reset_wave(all_sprites, invaders, player_bullets, enemy_bullets)
-
-        if pygame.sprite.spritecollide(player, enemy_bullets, True):
-            lives -= 1
-            HIT_SOUND.play()
-            if lives <= 0:
-                game_over = True
+                reset_wave(invaders, player_bullets, enemy_bullets)
+
+        ebullets = enemy_bullets.sprites()
+        if ebullets:
+            hit = collide_aabb([player.rect], [b.rect for b in ebullets])
+            if hit.any():
+                for bi in np.flatnonzero(hit[0]):
+                    ebullets[bi].kill()
+                lives -= 1
+                _beep(*HIT_BEEP).play()
+                if lives <= 0:
+                    game_over = True
 
-        for b in enemy_bullets.sprites():
-            struck = pygame.sprite.spritecollide(b, barriers, False)
-            if struck:
-                b.kill()
-                for bunker in struck:
-                    bunker.damage(1)
-
-        for b in player_bullets.sprites():
-            struck = pygame.sprite.spritecollide(b, barriers, False)
-            if struck:
-                b.kill()
-                for bunker in struck:
-                    bunker.damage(1)
-
-        # --- Draw ---
-        screen.fill(BLACK)
-        all_sprites.draw(screen)
-
-        score_text = font.render(f"Score: {score}", True, WHITE)
-        lives_text = font.render(f"Lives: {lives}", True, WHITE)
-        screen.blit(score_text, (10, 10))
-        screen.blit(lives_text, (SCREEN_WIDTH - lives_text.get_width() - 10, 10))
-
-        pygame.display.flip()
+        for group in (enemy_bullets, player_bullets):
+            for b in group.sprites():
+                cell_x = b.rect.centerx >> BARRIER_CELL_SHIFT
+                cell_y = b.rect.centery >> BARRIER_CELL_SHIFT
+                struck = []
+                for cx in (cell_x - 1, cell_x, cell_x + 1):
+                    for cy in (cell_y - 1, cell_y, cell_y + 1):
+                        for bunker in barrier_grid.get((cx, cy), ()):
+                            if bunker.hp > 0 and bunker not in struck and b.rect.colliderect(bunker.rect):
+                                struck.append(bunker)
+                if struck:
+                    b.kill()
+                    for bunker in struck:
+                        bunker.damage(1)
+
+        # --- Draw (dirty rects: erase last frame's regions, redraw, update both) ---
+        for r in prev_rects:
+            fill(BLACK, r)
+
+        # One C-level batch call instead of a Python blit per sprite.
+        blits([(s.image, s.rect) for s in all_sprites], doreturn=False)
+        new_rects = [tuple(s.rect) for s in all_sprites]
+        new_rects += invaders.draw(screen)
+
+        if last_hud != (score, lives):
+            last_hud = (score, lives)
+            score_surf = hud(f"Score: {score}")
+            lives_surf = hud(f"Lives: {lives}")
+            score_rect = (10, 10) + score_surf.get_size()
+            lives_rect = (SCREEN_WIDTH - lives_surf.get_width() - 10, 10) + lives_surf.get_size()
+        blit(score_surf, score_rect[:2])
+        blit(lives_surf, lives_rect[:2])
+        new_rects.append(score_rect)
+        new_rects.append(lives_rect)
+
+        update_display(prev_rects + new_rects)
+        prev_rects = new_rects
 
 
 if __name__ == "__main__":
@@ -1,13 +1,26 @@
+import math
 import sys
 import random
+from array import array
+import numpy as np
 import pygame
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernel below also runs uncompiled
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+        return wrap
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Config
 # ──────────────────────────────────────────────────────────────────────────────
 SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600
 TILE_SIZE = 32
 FPS = 60
+TICK_SCALE = 1.0 / 1000.0   # ms → s as one multiply per frame
+FIXED_DT   = 1.0 / FPS      # constant physics step; update() always sees this
 
 # World feel (NES-ish; hold Shift/X to run which is > NES walk speed)
 WALK_MAX_SPEED = 160.0      # px/s  (~5 tiles/s)
@@ -20,6 +33,12 @@ MAX_FALL_SPEED = 1400.0     # px/s
 COYOTE_TIME    = 0.08       # s after leaving a ledge where jump still works
 JUMP_BUFFER    = 0.12       # s before landing we can queue a jump
 
+# Partially evaluated for the fixed step: with dt constant, the per-step
+# dt products fold to module constants
+_ACCEL_DT    = ACCEL * FIXED_DT
+_FRICTION_DT = FRICTION * FIXED_DT
+_GRAVITY_DT  = GRAVITY * FIXED_DT
+
 # Colors (NES-ish palette)
 SKY         = (172, 206, 255)
 GROUND      = (139, 76, 39)
@@ -33,11 +52,90 @@ PATH_COLOR  = (245, 245, 245)
 LOCKED_GRAY = (100, 100, 100)
 CLEAR_GREEN = (60, 190, 60)
 
+# Key codes bound at module level so the per-frame input block skips the
+# pygame attribute lookups
+_K_LEFT, _K_RIGHT    = pygame.K_LEFT, pygame.K_RIGHT
+_K_A, _K_D, _K_X     = pygame.K_a, pygame.K_d, pygame.K_x
+_K_LSHIFT, _K_RSHIFT = pygame.K_LSHIFT, pygame.K_RSHIFT
+
 # ──────────────────────────────────────────────────────────────────────────────
-# Helpers
+# Physics kernel
 # ──────────────────────────────────────────────────────────────────────────────
-def sign(x: float) -> int:
-    return (x > 0) - (x < 0)
+@njit(cache=True)
+def _step_player(fx, fy, pw, ph, vx, vy, coyote, jump_buf, on_ground,
+                 left, right, running, dt, tile_l, tile_t, tile_r, tile_b):
+    """One full physics step as scalar math over the tile SoA bounds.
+
+    Everything Player.update used to do in interpreted Python — input
+    accel/friction, timers, jump, gravity, both axis collision passes —
+    happens here so numba can compile the whole step as one unit. The
+    compiled scan over the merged tile set replaces the old per-Rect
+    Python loops (and beats `Rect.collidelistall`, which would hand the
+    hit list back to interpreted code for resolution); it is cheap
+    enough that no broad phase is needed.
+    """
+    max_speed = RUN_MAX_SPEED if running else WALK_MAX_SPEED
+
+    if left ^ right:
+        vx += _ACCEL_DT * (right - left)
+    elif vx > 0.0:
+        vx = max(0.0, vx - _FRICTION_DT)   # friction without sign juggling
+    elif vx < 0.0:
+        vx = min(0.0, vx + _FRICTION_DT)
+    if abs(vx) > max_speed:
+        vx = math.copysign(max_speed, vx)
+
+    if on_ground:
+        coyote = COYOTE_TIME
+    else:
+        coyote = max(0.0, coyote - dt)
+    if jump_buf > 0.0:
+        jump_buf = max(0.0, jump_buf - dt)
+
+    if jump_buf > 0.0 and (on_ground or coyote > 0.0):
+        vy = -JUMP_SPEED
+        on_ground = False
+        coyote = 0.0
+        jump_buf = 0.0
+
+    vy = min(vy + _GRAVITY_DT, MAX_FALL_SPEED)
+
+    # fused collision pass: integrate both axes on the float position
+    # (sub-pixel motion accumulates instead of rounding away), then
+    # resolve each overlapping tile along its axis of least penetration
+    fx += vx * dt
+    fy += vy * dt
+    px = int(fx)
+    py = int(fy)
+    on_ground = False
+    if vx != 0.0 or vy != 0.0:
+        for i in range(tile_l.shape[0]):
+            tl = tile_l[i]
+            tt = tile_t[i]
+            tr = tile_r[i]
+            tb = tile_b[i]
+            if px + pw > tl and px < tr and py + ph > tt and py < tb:
+                pen_lft = px + pw - tl
+                pen_rgt = tr - px
+                pen_top = py + ph - tt
+                pen_bot = tb - py
+                if min(pen_lft, pen_rgt) < min(pen_top, pen_bot):
+                    if pen_lft < pen_rgt:
+                        px = tl - pw
+                    else:
+                        px = tr
+                    vx = 0.0
+                    fx = float(px)  # re-sync the float to the snap
+                else:
+                    if pen_top < pen_bot:
+                        py = tt - ph
+                        on_ground = True
+                    else:
+                        py = tb
+                    vy = 0.0
+                    fy = float(py)
+
+    return fx, fy, vx, vy, coyote, jump_buf, on_ground
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Player
@@ -47,7 +145,10 @@ class Player(pygame.sprite.Sprite):
         super().__init__()
         if not frames:
             raise ValueError("Frames list cannot be empty")
-        self.frames = frames
+        # right-facing frames as given; left-facing mirrored once here so
+        # no flip ever happens at draw time
+        self.frames_right = frames
+        self.frames_left = [pygame.transform.flip(f, True, False) for f in frames]
         self.image = frames[0]
         self.rect = self.image.get_rect()
 
@@ -78,6 +179,9 @@ class Player(pygame.sprite.Sprite):
         self._reset_to_spawn()
 
     def _reset_to_spawn(self):
+        # float position is authoritative; the rect is its integer shadow
+        self._fx = float(self.spawn_x)
+        self._fy = float(self.spawn_y)
         self.rect.x = int(self.spawn_x)
         self.rect.y = int(self.spawn_y)
         self.vx = 0.0
@@ -88,95 +192,96 @@ class Player(pygame.sprite.Sprite):
 
     def respawn(self):
         self._reset_to_spawn()
-        self.image = self.frames[0]
+        self.facing = 1
+        self.image = self.frames_right[0]
 
-    def handle_event(self, event):
-        if event.type == pygame.KEYDOWN and event.key in (pygame.K_SPACE, pygame.K_z, pygame.K_UP):
+    def handle_event(self, event,
+                     _keydown=pygame.KEYDOWN,
+                     _jump_keys=(pygame.K_SPACE, pygame.K_z, pygame.K_UP)):
+        # constants bound as defaults resolve as LOAD_FAST per event
+        if event.type == _keydown and event.key in _jump_keys:
             self.jump_buf = JUMP_BUFFER
 
-    def update(self, keys, tiles, dt):
-        # ── Input/desired speed
-        left  = keys[pygame.K_LEFT] or keys[pygame.K_a]
-        right = keys[pygame.K_RIGHT] or keys[pygame.K_d]
-        running = keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT] or keys[pygame.K_x]
-        max_speed = RUN_MAX_SPEED if running else WALK_MAX_SPEED
-
-        # ── Horizontal accel/friction
+    def update(self, keys, tile_soa, dt,
+               _kl=_K_LEFT, _kr=_K_RIGHT, _ka=_K_A, _kd=_K_D,
+               _kls=_K_LSHIFT, _krs=_K_RSHIFT, _kx=_K_X,
+               _step=_step_player):
+        # ── Input/desired speed (one pass over the key snapshot; bitwise
+        #    | folds the bool ints; constants arrive as defaults so the
+        #    interpreter loads them as LOAD_FAST, not LOAD_GLOBAL)
+        k = keys
+        left    = k[_kl] | k[_ka]
+        right   = k[_kr] | k[_kd]
+        running = k[_kls] | k[_krs] | k[_kx]
         if left ^ right:
-            ax = -ACCEL if left else ACCEL
-            self.vx += ax * dt
-            self.facing = -1 if left else 1
-        else:
-            if self.vx != 0.0:
-                decel = FRICTION * dt * sign(self.vx)
-                if abs(decel) > abs(self.vx):
-                    self.vx = 0.0
-                else:
-                    self.vx -= decel
+            self.facing = right - left
 
-        # clamp to target max
-        if abs(self.vx) > max_speed:
-            self.vx = max_speed * sign(self.vx)
+        # at rest the step is a fixed point (gravity's sub-pixel sink is
+        # snapped back to the tile top every frame), so standing still on
+        # ground with no input lets us skip the kernel call outright; any
+        # key press or nonzero velocity falls through and wakes it
+        if (self.on_ground and self.vx == 0.0 and self.vy == 0.0
+                and not (left | right) and self.jump_buf == 0.0):
+            self.coyote = COYOTE_TIME  # the kernel would refresh this too
+            return
 
-        # ── Timers
-        if self.on_ground:
-            self.coyote = COYOTE_TIME
-        else:
-            self.coyote = max(0.0, self.coyote - dt)
-        if self.jump_buf > 0.0:
-            self.jump_buf = max(0.0, self.jump_buf - dt)
-
-        # ── Jump
-        if self.jump_buf > 0.0 and (self.on_ground or self.coyote > 0.0):
-            self.vy = -JUMP_SPEED
-            self.on_ground = False
-            self.coyote = 0.0
-            self.jump_buf = 0.0
-
-        # ── Gravity
-        self.vy = min(self.vy + GRAVITY * dt, MAX_FALL_SPEED)
-
-        # ── Axis-separated movement & collision
-        self.rect.x += int(round(self.vx * dt))
-        for tile in tiles:
-            if self.rect.colliderect(tile):
-                if self.vx > 0:
-                    self.rect.right = tile.left
-                elif self.vx < 0:
-                    self.rect.left = tile.right
-                self.vx = 0.0
-
-        self.rect.y += int(round(self.vy * dt))
-        self.on_ground = False
-        for tile in tiles:
-            if self.rect.colliderect(tile):
-                if self.vy > 0:
-                    self.rect.bottom = tile.top
-                    self.vy = 0.0
-                    self.on_ground = True
-                elif self.vy < 0:
-                    self.rect.top = tile.bottom
-                    self.vy = 0.0
+        # thin wrapper: the whole step runs in one (njit-compiled) call
+        r = self.rect
+        (self._fx, self._fy, self.vx, self.vy, self.coyote, self.jump_buf,
+         self.on_ground) = _step(
+            self._fx, self._fy, r.w, r.h, self.vx, self.vy, self.coyote,
+            self.jump_buf, self.on_ground, left, right, running, dt,
+            tile_soa[0], tile_soa[1], tile_soa[2], tile_soa[3])
+        r.x = int(self._fx)
+        r.y = int(self._fy)
+
+        # pick the cached frame for the current facing
+        self.image = (self.frames_right if self.facing > 0 else self.frames_left)[0]
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Level Generation
 # ──────────────────────────────────────────────────────────────────────────────
 def generate_level(width_tiles, height_tiles):
-    """Generate a simple level with ground and some platforms"""
-    level = []
-    
+    """Generate a simple level with ground and some platforms.
+
+    Returns an (N, 4) int32 array of (left, top, right, bottom) rows —
+    the primary tile representation; Rects are derived from it only
+    where rendering needs them.
+    """
+    ts = TILE_SIZE
+    xs = np.arange(width_tiles, dtype=np.int32) * ts
+
     # Create ground tiles
-    for x in range(width_tiles):
-        level.append(pygame.Rect(x * TILE_SIZE, (height_tiles - 1) * TILE_SIZE, TILE_SIZE, TILE_SIZE))
-        # Add some ground tiles above the bottom
-        if x % 3 == 0:
-            level.append(pygame.Rect(x * TILE_SIZE, (height_tiles - 2) * TILE_SIZE, TILE_SIZE, TILE_SIZE))
-    
+    y = np.int32((height_tiles - 1) * ts)
+    ground = np.stack((xs, np.full_like(xs, y), xs + ts, np.full_like(xs, y + ts)), axis=1)
+
+    # Add some ground tiles above the bottom
+    xs2 = xs[::3]
+    y = np.int32((height_tiles - 2) * ts)
+    second = np.stack((xs2, np.full_like(xs2, y), xs2 + ts, np.full_like(xs2, y + ts)), axis=1)
+
     # Add some platforms
-    for x in range(5, width_tiles - 5, 8):
-        level.append(pygame.Rect(x * TILE_SIZE, (height_tiles - 4) * TILE_SIZE, TILE_SIZE * 3, TILE_SIZE))
-    
-    return level
+    xs3 = np.arange(5, width_tiles - 5, 8, dtype=np.int32) * ts
+    y = np.int32((height_tiles - 4) * ts)
+    platforms = np.stack((xs3, np.full_like(xs3, y), xs3 + 3 * ts, np.full_like(xs3, y + ts)), axis=1)
+
+    return merge_tile_runs(np.concatenate((ground, second, platforms)))
+
+def merge_tile_runs(bounds):
+    """Collapse horizontally adjacent same-row spans into single rows.
+
+    A continuous floor of N unit tiles becomes one wide span, shrinking
+    both the collision set and the number of rects drawn per frame.
+    """
+    order = np.lexsort((bounds[:, 0], bounds[:, 1]))
+    merged = []
+    for l, t, r, b in bounds[order]:
+        last = merged[-1] if merged else None
+        if last is not None and last[1] == t and last[3] == b and last[2] == l:
+            last[2] = r
+        else:
+            merged.append([l, t, r, b])
+    return np.array(merged, dtype=np.int32)
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Game Class
@@ -195,42 +300,76 @@ class Game:
         ]
         for frame in player_frames:
             frame.fill(PLAYER_RED)
-        
+        # match the display pixel format up front so blits are straight copies
+        player_frames = [frame.convert_alpha() for frame in player_frames]
+
         self.player = Player(player_frames)
-        self.tiles = generate_level(SCREEN_WIDTH // TILE_SIZE, SCREEN_HEIGHT // TILE_SIZE)
-        
+        bounds = generate_level(SCREEN_WIDTH // TILE_SIZE, SCREEN_HEIGHT // TILE_SIZE)
+
+        # Canonical tile storage: one flat C-int buffer, 4 ints per tile
+        # (l, t, r, b). The kernel reads zero-copy int32 views of it;
+        # Rects exist only so the background painter can draw the tiles.
+        self.tile_bounds = array('i', bounds.ravel().tolist())
+        view = np.frombuffer(self.tile_bounds, dtype=np.int32).reshape(-1, 4)
+        self.tile_soa = (view[:, 0], view[:, 1], view[:, 2], view[:, 3])
+        self.tiles = [pygame.Rect(l, t, r - l, b - t) for l, t, r, b in view]
+        # warm the JIT so compilation doesn't land on the first frame
+        # (bools for left/right/running so this compiles the same
+        # signature the live key-state call uses)
+        _step_player(0.0, 0.0, TILE_SIZE, TILE_SIZE, 0.0, 0.0, 0.0, 0.0, False,
+                     False, False, False, FIXED_DT, *self.tile_soa)
+
+        # Tiles never move, so paint sky + tiles once and blit the result
+        self.bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.bg.fill(SKY)
+        for tile in self.tiles:
+            pygame.draw.rect(self.bg, GROUND, tile)
+        self.bg = self.bg.convert()
+
+        # Key snapshot cached between frames; only a KEYDOWN/KEYUP can
+        # change it, so refresh lazily instead of polling every update
+        self._keys = pygame.key.get_pressed()
+        self._keys_dirty = False
+
         self.running = True
-        
+
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type == pygame.KEYDOWN or event.type == pygame.KEYUP:
+                self._keys_dirty = True
             self.player.handle_event(event)
-    
+
     def update(self, dt):
-        keys = pygame.key.get_pressed()
-        self.player.update(keys, self.tiles, dt)
+        if self._keys_dirty:
+            self._keys = pygame.key.get_pressed()
+            self._keys_dirty = False
+        self.player.update(self._keys, self.tile_soa, dt)
     
     def render(self):
-        self.screen.fill(SKY)
-        
-        # Draw tiles
-        for tile in self.tiles:
-            pygame.draw.rect(self.screen, GROUND, tile)
-        
-        # Draw player
-        self.screen.blit(self.player.image, self.player.rect)
-        
+        # One batched submission: background, player, and whatever
+        # dynamic sprites get appended here later
+        draw_list = [
+            (self.bg, (0, 0)),
+            (self.player.image, self.player.rect),
+        ]
+        self.screen.blits(draw_list, doreturn=False)
+
         pygame.display.flip()
     
     def run(self):
+        accum = 0.0
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0  # Convert to seconds
-            
+            accum += self.clock.tick(FPS) * TICK_SCALE
+
             self.handle_events()
-            self.update(dt)
+            # fixed-step physics: bank real time, step at constant dt
+            while accum >= FIXED_DT:
+                self.update(FIXED_DT)
+                accum -= FIXED_DT
             self.render()
-        
+
         pygame.quit()
 
 def main():
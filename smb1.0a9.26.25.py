@@ -1,186 +1,7 @@
-import sys
-import random
-import pygame
-
-# ──────────────────────────────────────────────────────────────────────────────
-# Config
-# ──────────────────────────────────────────────────────────────────────────────
-SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600
-TILE_SIZE = 32
-FPS = 60
-
-# World feel (NES-ish; hold Shift/X to run which is > NES walk speed)
-WALK_MAX_SPEED = 160.0      # px/s  (~5 tiles/s)
-RUN_MAX_SPEED  = 240.0      # px/s  (~7.5 tiles/s)
-ACCEL          = 3200.0     # px/s²
-FRICTION       = 3600.0     # px/s²
-GRAVITY        = 3000.0     # px/s²
-JUMP_SPEED     = 900.0      # px/s   (initial jump velocity)
-MAX_FALL_SPEED = 1400.0     # px/s
-COYOTE_TIME    = 0.08       # s after leaving a ledge where jump still works
-JUMP_BUFFER    = 0.12       # s before landing we can queue a jump
-
-# Colors (NES-ish palette)
-SKY         = (172, 206, 255)
-GROUND      = (139, 76, 39)
-FLAG_GREEN  = (34, 177, 76)
-COIN_YELLOW = (255, 236, 134)
-PLAYER_RED  = (206, 52, 52)
-WHITE       = (255, 255, 255)
-UI_SHADOW   = (16, 22, 48)
-WATER_BLUE  = (80, 140, 255)
-PATH_COLOR  = (245, 245, 245)
-LOCKED_GRAY = (100, 100, 100)
-CLEAR_GREEN = (60, 190, 60)
-
-# ──────────────────────────────────────────────────────────────────────────────
-# Helpers
-# ──────────────────────────────────────────────────────────────────────────────
-def sign(x: float) -> int:
-    return (x > 0) - (x < 0)
-
-# ──────────────────────────────────────────────────────────────────────────────
-# Player
-# ──────────────────────────────────────────────────────────────────────────────
-class Player(pygame.sprite.Sprite):
-    def __init__(self, frames):
-        super().__init__()
-        if not frames:
-            raise ValueError("Frames list cannot be empty")
-        self.frames = frames
-        self.image = frames[0]
-        self.rect = self.image.get_rect()
-
-        # spawn set per-level
-        self.spawn_x = TILE_SIZE
-        self.spawn_y = SCREEN_HEIGHT - 6 * TILE_SIZE
-
-        # Physics
-        self.vx = 0.0
-        self.vy = 0.0
-        self.facing = 1
-        self.on_ground = False
-
-        # Timers
-        self.coyote = 0.0
-        self.jump_buf = 0.0
-
-        # Meta
-        self.coins = 0
-        self.world = 1
-        self.level = 1
-
-        self._reset_to_spawn()
-
-    def set_spawn(self, x, y):
-        self.spawn_x = x
-        self.spawn_y = y
-        self._reset_to_spawn()
-
-    def _reset_to_spawn(self):
-        self.rect.x = int(self.spawn_x)
-        self.rect.y = int(self.spawn_y)
-        self.vx = 0.0
-        self.vy = 0.0
-        self.on_ground = False
-        self.coyote = 0.0
-        self.jump_buf = 0.0
-
-    def respawn(self):
-        self._reset_to_spawn()
-        self.image = self.frames[0]
-
-    def handle_event(self, event):
-        if event.type == pygame.KEYDOWN and event.key in (pygame.K_SPACE, pygame.K_z, pygame.K_UP):
-            self.jump_buf = JUMP_BUFFER
-
-    def update(self, keys, tiles, dt):
-        # ── Input/desired speed
-        left  = keys[pygame.K_LEFT] or keys[pygame.K_a]
-        right = keys[pygame.K_RIGHT] or keys[pygame.K_d]
-        running = keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT] or keys[pygame.K_x]
-        max_speed = RUN_MAX_SPEED if running else WALK_MAX_SPEED
-
-        # ── Horizontal accel/friction
-        if left ^ right:
-            ax = -ACCEL if left else ACCEL
-            self.vx += ax * dt
-            self.facing = -1 if left else 1
-        else:
-            if self.vx != 0.0:
-                decel = FRICTION * dt * sign(self.vx)
-                if abs(decel) > abs(self.vx):
-                    self.vx = 0.0
-                else:
-                    self.vx -= decel
-
-        # clamp to target max
-        if abs(self.vx) > max_speed:
-            self.vx = max_speed * sign(self.vx)
-
-        # ── Timers
-        if self.on_ground:
-            self.coyote = COYOTE_TIME
-        else:
-            self.coyote = max(0.0, self.coyote - dt)
-        if self.jump_buf > 0.0:
-            self.jump_buf = max(0.0, self.jump_buf - dt)
-
-        # ── Jump
-        if self.jump_buf > 0.0 and (self.on_ground or self.coyote > 0.0):
-            self.vy = -JUMP_SPEED
-            self.on_ground = False
-            self.coyote = 0.0
-            self.jump_buf = 0.0
-
-        # ── Gravity
-        self.vy = min(self.vy + GRAVITY * dt, MAX_FALL_SPEED)
-
-        # ── Axis-separated movement & collision
-        self.rect.x += int(round(self.vx * dt))
-        for tile in tiles:
-            if self.rect.colliderect(tile):
-                if self.vx > 0:
-                    self.rect.right = tile.left
-                elif self.vx < 0:
-                    self.rect.left = tile.right
-                self.vx = 0.0
-
-        self.rect.y += int(round(self.vy * dt))
-        self.on_ground = False
-        for tile in tiles:
-            if self.rect.colliderect(tile):
-                if self.vy > 0:
-                    self.rect.bottom = tile.top
-                    self.vy = 0.0
-                    self.on_ground = True
-                elif self.vy < 0:
-                    self.rect.top = tile.bottom
-                    self.vy = 0.0
-
-# ──────────────────────────────────────────────────────────────────────────────
-# Level Generation
-# ──────────────────────────────────────────────────────────────────────────────
-def generate_level(width_tiles, height_tiles):
-    """Generate a simple level with ground and some platforms"""
-    level = []
-    
-    # Create ground tiles
-    for x in range(width_tiles):
-        level.append(pygame.Rect(x * TILE_SIZE, (height_tiles - 1) * TILE_SIZE, TILE_SIZE, TILE_SIZE))
-        # Add some ground tiles above the bottom
-        if x % 3 == 0:
-            level.append(pygame.Rect(x * TILE_SIZE, (height_tiles - 2) * TILE_SIZE, TILE_SIZE, TILE_SIZE))
-    
-    # Add some platforms
-    for x in range(5, width_tiles - 5, 8):
-        level.append(pygame.Rect(x * TILE_SIZE, (height_tiles - 4) * TILE_SIZE, TILE_SIZE * 3, TILE_SIZE))
-    
-    return level
 #!/usr/bin/env python3
 """
 Samsoft DS Engine — single-file demo (Pygame 2.5+)
-Window: 600x400 @ 60 FPS (internal 300x200 buffer, 2x nearest-neighbor upscale)
+Window: 300x200 logical @ 60 FPS (pygame.SCALED upscales to the display)
 
 Controls:
   ←/→  move
@@ -197,12 +18,10 @@ import pygame
 # ──────────────────────────────────────────────────────────────────────────────
 # Config (DS-ish tuning)
 # ──────────────────────────────────────────────────────────────────────────────
-SCREEN_W, SCREEN_H = 600, 400        # Output window
-FRAME_W,  FRAME_H  = 300, 200        # Internal buffer (crisp 2x → 600x400)
-SCALE_X, SCALE_Y   = SCREEN_W // FRAME_W, SCREEN_H // FRAME_H
-assert SCALE_X >= 1 and SCALE_Y >= 1, "Window must be >= internal frame"
+FRAME_W, FRAME_H = 300, 200           # Logical size; pygame.SCALED upscales
 
 FPS        = 60
+PHYS_STEP  = 1.0 / 120.0              # fixed physics step (s); render interpolates
 TILE_SIZE  = 16                       # DS-like tile size
 # Keep similar *tile* feel as your earlier settings (converted for 16px tiles)
 WALK_MAX_SPEED   = 5.0  * TILE_SIZE   # px/s  (≈80)
@@ -235,15 +54,20 @@ JUMP_KEYS = {pygame.K_SPACE, pygame.K_z, pygame.K_w, pygame.K_UP}
 # Tiles:
 # '.' empty sky, 'P' grass/dirt ground (solid), '#' block (solid),
 # '=' platform top (one-way), 'C' coin, 'F' flagpole, 'S' spawn
-SOLID_TILES   = {'P', '#'}
-ONE_WAY_TILES = {'='}
+# Stored internally as tile byte values (the map lives in a bytearray).
+ORD_DOT  = ord('.')
+ORD_P    = ord('P')
+ORD_HASH = ord('#')
+ORD_EQ   = ord('=')
+ORD_C    = ord('C')
+ORD_F    = ord('F')
+ORD_S    = ord('S')
+SOLID_TILES   = {ORD_P, ORD_HASH}
+ONE_WAY_TILES = {ORD_EQ}
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Helpers
 # ──────────────────────────────────────────────────────────────────────────────
-def sign(x: float) -> int:
-    return (x > 0) - (x < 0)
-
 def clamp(v, lo, hi):
     return lo if v < lo else hi if v > hi else v
 
@@ -251,12 +75,22 @@ def clamp(v, lo, hi):
 # Coin sprite (little bob + shine)
 # ──────────────────────────────────────────────────────────────────────────────
 class Coin(pygame.sprite.Sprite):
+    # One cycle of bob offsets; indexed by time so there's no per-frame
+    # trig and no drift from accumulating into rect.y.
+    _BOB = [round(math.sin(i / 16 * 2 * math.pi) * 1.5) for i in range(16)]
+
+    # All coins look identical, so they share one Surface.
+    _image = None
+
     def __init__(self, x, y):
         super().__init__()
-        self.base = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-        self._draw_coin(self.base)
-        self.image = self.base.copy()
+        if Coin._image is None:
+            base = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+            self._draw_coin(base)
+            Coin._image = base
+        self.image = Coin._image
         self.rect  = self.image.get_rect(topleft=(x, y))
+        self.base_y = y
         self.t     = random.random() * 100.0
 
     def _draw_coin(self, surf):
@@ -269,18 +103,76 @@ class Coin(pygame.sprite.Sprite):
 
     def update(self, dt):
         self.t += dt
-        bob = math.sin(self.t * 6.0) * 1.5
-        self.rect.y = int(self.rect.y - bob)  # cheap visual bob (no world gravity)
-        # Keep image same size; visual only
+        self.rect.y = self.base_y + Coin._BOB[int(self.t * 12.0) & 15]
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Static quadtree broad phase
+# ──────────────────────────────────────────────────────────────────────────────
+class QuadTree:
+    """Quadtree over axis-aligned rects that never move (tiles).
+
+    Built once at level load; query() walks only the nodes the probe
+    rect overlaps, so cost stays logarithmic as entity counts grow. A
+    rect straddling a split line lives in several leaves and can be
+    returned more than once — callers that only clamp against edges
+    don't care.
+    """
+    __slots__ = ('bounds', 'depth', 'items', 'children')
+    MAX_ITEMS = 8
+    MAX_DEPTH = 6
+
+    def __init__(self, bounds, depth=0):
+        self.bounds = bounds
+        self.depth = depth
+        self.items = []       # (rect, payload)
+        self.children = None
+
+    def insert(self, rect, payload):
+        if self.children is not None:
+            for child in self.children:
+                if child.bounds.colliderect(rect):
+                    child.insert(rect, payload)
+            return
+        self.items.append((rect, payload))
+        if len(self.items) > self.MAX_ITEMS and self.depth < self.MAX_DEPTH:
+            self._split()
+
+    def _split(self):
+        b = self.bounds
+        hw, hh = b.w // 2, b.h // 2
+        d = self.depth + 1
+        self.children = [
+            QuadTree(pygame.Rect(b.x,      b.y,      hw,       hh),       d),
+            QuadTree(pygame.Rect(b.x + hw, b.y,      b.w - hw, hh),       d),
+            QuadTree(pygame.Rect(b.x,      b.y + hh, hw,       b.h - hh), d),
+            QuadTree(pygame.Rect(b.x + hw, b.y + hh, b.w - hw, b.h - hh), d),
+        ]
+        items, self.items = self.items, []
+        for rect, payload in items:
+            self.insert(rect, payload)
+
+    def query(self, rect, out=None):
+        if out is None:
+            out = []
+        if self.children is not None:
+            for child in self.children:
+                if child.bounds.colliderect(rect):
+                    child.query(rect, out)
+        else:
+            for r, payload in self.items:
+                if rect.colliderect(r):
+                    out.append(payload)
+        return out
 
 # ──────────────────────────────────────────────────────────────────────────────
 # TileMap with grid collisions and drawing
 # ──────────────────────────────────────────────────────────────────────────────
 class TileMap:
-    def __init__(self, grid):
-        self.grid = [list(row) for row in grid]
-        self.h = len(self.grid)
-        self.w = len(self.grid[0]) if self.h else 0
+    def __init__(self, level):
+        # level is (buf, w, h): a row-major bytearray of tile bytes, one
+        # per cell. Far smaller than nested lists of one-char strings and
+        # friendlier to the collision loops.
+        self.grid, self.w, self.h = level
         self.pixel_w = self.w * TILE_SIZE
         self.pixel_h = self.h * TILE_SIZE
 
@@ -288,44 +180,117 @@ class TileMap:
         self.flag_rect = None
         self.spawn = (TILE_SIZE, TILE_SIZE)
 
-        for ty, row in enumerate(self.grid):
-            for tx, ch in enumerate(row):
+        # The tile art never changes, so paint the whole map once and let
+        # draw() blit a camera-sized slice instead of ~1200 rect fills/frame.
+        self._tilemap_surf = self._prerender_tiles()
+
+        # Sky gradient is static too; resample it once instead of per frame.
+        top = pygame.Surface((1, 2))
+        top.set_at((0, 0), SKY_TOP)
+        top.set_at((0, 1), SKY_BOTTOM)
+        self._sky_bg = pygame.transform.smoothscale(top, (FRAME_W, FRAME_H)).convert()
+
+        buf = self.grid
+        for ty in range(self.h):
+            row0 = ty * self.w
+            for tx in range(self.w):
+                ch = buf[row0 + tx]
                 x, y = tx*TILE_SIZE, ty*TILE_SIZE
-                if ch == 'C':
+                if ch == ORD_C:
                     self.coins.add(Coin(x, y - 2))  # slight lift
-                    self.grid[ty][tx] = '.'        # not solid
-                elif ch == 'F':
+                    buf[row0 + tx] = ORD_DOT       # not solid
+                elif ch == ORD_F:
                     self.flag_rect = pygame.Rect(x, y - 3*TILE_SIZE, TILE_SIZE, 3*TILE_SIZE)
-                elif ch == 'S':
+                elif ch == ORD_S:
                     self.spawn = (x, y - TILE_SIZE)
 
+        # Every solid/one-way cell gets its Rect up front, so collision
+        # queries are plain dict probes with no Rect churn.
+        self.solid_rects = {}
+        for ty in range(self.h):
+            row0 = ty * self.w
+            for tx in range(self.w):
+                ch = buf[row0 + tx]
+                if ch in SOLID_TILES or ch in ONE_WAY_TILES:
+                    self.solid_rects[(tx, ty)] = (
+                        ch, pygame.Rect(tx*TILE_SIZE, ty*TILE_SIZE, TILE_SIZE, TILE_SIZE))
+
+        # Broad phase over the solid cells; static, so built once and
+        # never rebuilt.
+        self.quadtree = QuadTree(pygame.Rect(0, 0, self.pixel_w, self.pixel_h))
+        for pair in self.solid_rects.values():
+            self.quadtree.insert(pair[1], pair)
+
+        # Coins bucketed by tile coordinate: pickup checks touch only the
+        # buckets under the player instead of the whole Group.
+        self.coin_buckets = {}
+        for c in self.coins:
+            key = (c.rect.x // TILE_SIZE, c.rect.y // TILE_SIZE)
+            self.coin_buckets.setdefault(key, []).append(c)
+
+    def _prerender_tiles(self):
+        surf = pygame.Surface((self.pixel_w, self.pixel_h), pygame.SRCALPHA)
+        buf = self.grid
+        for ty in range(self.h):
+            row0 = ty * self.w
+            for tx in range(self.w):
+                ch = buf[row0 + tx]
+                x, y = tx*TILE_SIZE, ty*TILE_SIZE
+                if ch == ORD_P:
+                    # grass top + dirt body
+                    pygame.draw.rect(surf, DIRT_MAIN, (x, y, TILE_SIZE, TILE_SIZE))
+                    pygame.draw.rect(surf, DIRT_DARK, (x, y+TILE_SIZE-3, TILE_SIZE, 3))
+                    pygame.draw.rect(surf, GRASS_DARK,(x, y, TILE_SIZE, 4))
+                    pygame.draw.rect(surf, GRASS_LIGHT,(x, y, TILE_SIZE, 2))
+                elif ch == ORD_HASH:
+                    pygame.draw.rect(surf, (118, 96, 68), (x, y, TILE_SIZE, TILE_SIZE))
+                    pygame.draw.rect(surf, (92,  72, 48), (x, y, TILE_SIZE, 3))
+                    pygame.draw.rect(surf, (72,  56, 36), (x, y+TILE_SIZE-3, TILE_SIZE, 3))
+                elif ch == ORD_EQ:
+                    # one-way platform top
+                    pygame.draw.rect(surf, (90, 170, 90), (x, y+TILE_SIZE-4, TILE_SIZE, 4))
+        return surf
+
     def get(self, tx, ty):
         if 0 <= tx < self.w and 0 <= ty < self.h:
-            return self.grid[ty][tx]
-        return '.'  # out of bounds is air
-
-    def rects_around(self, rect):
-        """Return solid/oneway rects near AABB."""
-        results = []
-        tx0 = (rect.left  // TILE_SIZE) - 1
-        tx1 = (rect.right // TILE_SIZE) + 1
-        ty0 = (rect.top   // TILE_SIZE) - 1
-        ty1 = (rect.bottom// TILE_SIZE) + 1
-        for ty in range(ty0, ty1+1):
-            for tx in range(tx0, tx1+1):
-                ch = self.get(tx, ty)
-                if ch in SOLID_TILES or ch in ONE_WAY_TILES:
-                    results.append((ch, pygame.Rect(tx*TILE_SIZE, ty*TILE_SIZE, TILE_SIZE, TILE_SIZE)))
-        return results
+            return self.grid[ty*self.w + tx]
+        return ORD_DOT  # out of bounds is air
+
+    def collect_coins(self, rect):
+        """Kill coins overlapping rect; returns how many were taken.
+
+        Only probes the buckets under the rect's footprint (padded a row
+        up, since coins bob above their home tile).
+        """
+        got = 0
+        tx0 = rect.left // TILE_SIZE
+        tx1 = rect.right // TILE_SIZE
+        ty0 = rect.top // TILE_SIZE - 1
+        ty1 = rect.bottom // TILE_SIZE
+        buckets = self.coin_buckets
+        for ty in range(ty0, ty1 + 1):
+            for tx in range(tx0, tx1 + 1):
+                bucket = buckets.get((tx, ty))
+                if not bucket:
+                    continue
+                for c in bucket[:]:
+                    if rect.colliderect(c.rect):
+                        bucket.remove(c)
+                        c.kill()
+                        got += 1
+        return got
+
+    def query(self, rect):
+        """Return (tile, rect) pairs for solid/oneway cells near AABB.
+
+        Pads by one tile per side so sweeps see the cells they may move
+        into, not just the ones currently overlapped.
+        """
+        return self.quadtree.query(rect.inflate(2*TILE_SIZE, 2*TILE_SIZE))
 
     def draw(self, surf, camx, camy):
-        # Parallax sky (cheap two-band gradient + mountains)
-        surf.fill(SKY_BOTTOM)
-        top = pygame.Surface((1, 2))
-        top.fill(SKY_BOTTOM)
-        top.set_at((0, 0), SKY_TOP)
-        grad = pygame.transform.smoothscale(top, (FRAME_W, FRAME_H))
-        surf.blit(grad, (0, 0))
+        # Parallax sky (pre-built gradient + mountains)
+        surf.blit(self._sky_bg, (0, 0))
 
         # Mountains (slow parallax)
         off = int(camx * 0.25) % (FRAME_W + 120)
@@ -336,34 +301,8 @@ class TileMap:
                 [(base_x+20, FRAME_H-60), (base_x+120, FRAME_H-110), (base_x+220, FRAME_H-60)]
             )
 
-        # Draw tiles
-        vx0 = camx // TILE_SIZE
-        vy0 = camy // TILE_SIZE
-        tiles_x = FRAME_W // TILE_SIZE + 3
-        tiles_y = FRAME_H // TILE_SIZE + 3
-
-        for ty in range(vy0, vy0 + tiles_y):
-            for tx in range(vx0, vx0 + tiles_x):
-                ch = self.get(tx, ty)
-                if ch == 'P':
-                    # grass top + dirt body
-                    x = tx*TILE_SIZE - camx
-                    y = ty*TILE_SIZE - camy
-                    pygame.draw.rect(surf, DIRT_MAIN, (x, y, TILE_SIZE, TILE_SIZE))
-                    pygame.draw.rect(surf, DIRT_DARK, (x, y+TILE_SIZE-3, TILE_SIZE, 3))
-                    pygame.draw.rect(surf, GRASS_DARK,(x, y, TILE_SIZE, 4))
-                    pygame.draw.rect(surf, GRASS_LIGHT,(x, y, TILE_SIZE, 2))
-                elif ch == '#':
-                    x = tx*TILE_SIZE - camx
-                    y = ty*TILE_SIZE - camy
-                    pygame.draw.rect(surf, (118, 96, 68), (x, y, TILE_SIZE, TILE_SIZE))
-                    pygame.draw.rect(surf, (92,  72, 48), (x, y, TILE_SIZE, 3))
-                    pygame.draw.rect(surf, (72,  56, 36), (x, y+TILE_SIZE-3, TILE_SIZE, 3))
-                elif ch == '=':
-                    # one-way platform top
-                    x = tx*TILE_SIZE - camx
-                    y = ty*TILE_SIZE - camy
-                    pygame.draw.rect(surf, (90, 170, 90), (x, y+TILE_SIZE-4, TILE_SIZE, 4))
+        # Tiles: one slice blit from the pre-rendered map
+        surf.blit(self._tilemap_surf, (0, 0), (camx, camy, FRAME_W, FRAME_H))
 
         # Flag (if present)
         if self.flag_rect:
@@ -373,11 +312,12 @@ class TileMap:
             pygame.draw.polygon(surf, (34, 177, 76),
                                 [(fx+3, fy+6), (fx+3+10, fy+11), (fx+3, fy+16)])    # tiny flag
 
-        # Coins (draw after tiles)
-        for coin in self.coins:
-            cx = coin.rect.x - camx
-            cy = coin.rect.y - camy
-            surf.blit(coin.image, (cx, cy))
+        # Coins (draw after tiles): cull offscreen, batch through blits()
+        seq = [(c.image, (c.rect.x - camx, c.rect.y - camy))
+               for c in self.coins
+               if -TILE_SIZE <= c.rect.x - camx <= FRAME_W]
+        if seq:
+            surf.blits(seq, doreturn=0)
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Player
@@ -389,7 +329,10 @@ class Player(pygame.sprite.Sprite):
         self.image  = self.frames['idle']
         self.rect   = self.image.get_rect(topleft=spawn_xy)
 
-        # physics
+        # physics — float x/y are authoritative so sub-pixel motion
+        # accumulates; the rect is just the integer shadow
+        self.x = float(self.rect.x)
+        self.y = float(self.rect.y)
         self.vx = 0.0
         self.vy = 0.0
         self.facing = 1
@@ -398,6 +341,10 @@ class Player(pygame.sprite.Sprite):
         self.jump_buf = 0.0
         self.jump_held = False
 
+        # previous step's position, for render interpolation
+        self.prev_x = self.rect.x
+        self.prev_y = self.rect.y
+
         # meta
         self.coins = 0
 
@@ -417,7 +364,11 @@ class Player(pygame.sprite.Sprite):
         pygame.draw.rect(jump, PLAYER_SH, (0, 1, w, h-1))
         pygame.draw.rect(jump, PLAYER_RED,(0, 0, w, h-2))
         pygame.draw.rect(jump, WHITE,     (w-5, 2, 3, 2))
-        return {'idle': idle, 'run': run, 'jump': jump}
+        frames = {'idle': idle, 'run': run, 'jump': jump}
+        # left-facing variants flipped once here, not per frame in draw()
+        for name in ('idle', 'run', 'jump'):
+            frames[name + '_L'] = pygame.transform.flip(frames[name], True, False)
+        return frames
 
     def handle_event(self, e):
         if e.type == pygame.KEYDOWN and e.key in JUMP_KEYS:
@@ -429,30 +380,32 @@ class Player(pygame.sprite.Sprite):
                 self.vy *= JUMP_CUT_MULT  # variable jump height
 
     def update(self, keys, tilemap: TileMap, dt):
-        # desired max speed
-        running = keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT] or keys[pygame.K_x]
+        self.prev_x = self.rect.x
+        self.prev_y = self.rect.y
+        # one indexing pass over the key snapshot; | folds the bool ints
+        # without short-circuit jumps, and the hot constants become locals
+        left    = keys[pygame.K_LEFT] | keys[pygame.K_a]
+        right   = keys[pygame.K_RIGHT] | keys[pygame.K_d]
+        running = keys[pygame.K_LSHIFT] | keys[pygame.K_RSHIFT] | keys[pygame.K_x]
+        accel, friction, gravity, max_fall = ACCEL, FRICTION, GRAVITY, MAX_FALL_SPEED
         max_speed = RUN_MAX_SPEED if running else WALK_MAX_SPEED
 
-        # horizontal input
-        left  = keys[pygame.K_LEFT] or keys[pygame.K_a]
-        right = keys[pygame.K_RIGHT] or keys[pygame.K_d]
-
         if left ^ right:
-            ax = -ACCEL if left else ACCEL
+            ax = -accel if left else accel
             self.vx += ax * dt
             self.facing = -1 if left else 1
         else:
-            # friction
-            if self.vx != 0.0:
-                decel = FRICTION * dt * sign(self.vx)
-                if abs(decel) > abs(self.vx):
-                    self.vx = 0.0
-                else:
-                    self.vx -= decel
+            # friction, branchless on direction
+            vx = self.vx
+            decel = friction * dt
+            if decel > abs(vx):
+                self.vx = 0.0
+            else:
+                self.vx = vx - decel * ((vx > 0) - (vx < 0))
 
         # clamp horizontal
         if abs(self.vx) > max_speed:
-            self.vx = max_speed * sign(self.vx)
+            self.vx = math.copysign(max_speed, self.vx)
 
         # timers (coyote + jump buffer)
         self.coyote = COYOTE_TIME if self.on_ground else max(0.0, self.coyote - dt)
@@ -467,99 +420,150 @@ class Player(pygame.sprite.Sprite):
             self.jump_buf = 0.0
 
         # gravity
-        self.vy = min(self.vy + GRAVITY * dt, MAX_FALL_SPEED)
-
-        # ── axis-separated collisions
-        # X axis
-        self.rect.x += int(round(self.vx * dt))
-        for ch, tile in tilemap.rects_around(self.rect):
-            if ch in SOLID_TILES and self.rect.colliderect(tile):
-                if self.vx > 0:  self.rect.right = tile.left
-                elif self.vx < 0:self.rect.left  = tile.right
-                self.vx = 0.0
+        self.vy = min(self.vy + gravity * dt, max_fall)
+
+        # ── swept axis movement: clamp each step against the nearest
+        # blocking edge before moving, instead of teleport-then-resolve.
+        # Integrate on floats, derive the pixel delta, and re-snap the
+        # float to the rect only when a wall clamps us.
+        self.x += self.vx * dt
+        dx = int(self.x) - self.rect.x
+        nearby = None  # one broad-phase fetch serves both axis sweeps:
+        # query() pads a full tile while a step moves a few pixels at most
+        if dx:
+            nearby = tilemap.query(self.rect)
+            top, bottom = self.rect.top, self.rect.bottom
+            if dx > 0:
+                lead = self.rect.right
+                limit = lead + dx
+                for ch, tile in nearby:
+                    if (ch in SOLID_TILES and tile.bottom > top and tile.top < bottom
+                            and lead <= tile.left < limit):
+                        limit = tile.left
+                self.rect.right = limit
+                if limit < lead + dx:
+                    self.vx = 0.0
+                    self.x = float(self.rect.x)
+            else:
+                lead = self.rect.left
+                limit = lead + dx
+                for ch, tile in nearby:
+                    if (ch in SOLID_TILES and tile.bottom > top and tile.top < bottom
+                            and limit < tile.right <= lead):
+                        limit = tile.right
+                self.rect.left = limit
+                if limit > lead + dx:
+                    self.vx = 0.0
+                    self.x = float(self.rect.x)
 
-        # Y axis
+        self.y += self.vy * dt
+        dy = int(self.y) - self.rect.y
         self.on_ground = False
-        self.rect.y += int(round(self.vy * dt))
-        for ch, tile in tilemap.rects_around(self.rect):
-            if ch in SOLID_TILES and self.rect.colliderect(tile):
-                if self.vy > 0:
-                    self.rect.bottom = tile.top
+        if dy:
+            if nearby is None:
+                nearby = tilemap.query(self.rect)
+            leftx, rightx = self.rect.left, self.rect.right
+            if dy > 0:
+                lead = self.rect.bottom
+                limit = lead + dy
+                landed = False
+                for ch, tile in nearby:
+                    if tile.right <= leftx or tile.left >= rightx:
+                        continue
+                    # one-way platforms block only when we start above them,
+                    # which the sweep expresses as lead <= tile.top
+                    if ((ch in SOLID_TILES or ch in ONE_WAY_TILES)
+                            and lead <= tile.top < limit):
+                        limit = tile.top
+                        landed = True
+                self.rect.bottom = limit
+                if landed:
                     self.vy = 0.0
                     self.on_ground = True
-                elif self.vy < 0:
-                    self.rect.top = tile.bottom
+                    self.y = float(self.rect.y)
+            else:
+                lead = self.rect.top
+                limit = lead + dy
+                bumped = False
+                for ch, tile in nearby:
+                    if tile.right <= leftx or tile.left >= rightx:
+                        continue
+                    if ch in SOLID_TILES and limit < tile.bottom <= lead:
+                        limit = tile.bottom
+                        bumped = True
+                self.rect.top = limit
+                if bumped:
                     self.vy = 0.0
-            elif ch in ONE_WAY_TILES and self.rect.colliderect(tile):
-                # one-way: only stop when falling and above platform
-                if self.vy > 0 and (self.rect.bottom - tile.top) <= 8 and (self.rect.centery <= tile.top):
-                    self.rect.bottom = tile.top
-                    self.vy = 0.0
-                    self.on_ground = True
+                    self.y = float(self.rect.y)
 
         # sprite pose
         if not self.on_ground:
-            self.image = self.frames['jump']
+            pose = 'jump'
         elif abs(self.vx) > 8.0:
-            self.image = self.frames['run']
+            pose = 'run'
         else:
-            self.image = self.frames['idle']
+            pose = 'idle'
+        self.image = self.frames[pose if self.facing > 0 else pose + '_L']
 
-    def draw(self, surf, camx, camy):
-        img = self.image
-        if self.facing < 0:
-            img = pygame.transform.flip(img, True, False)
-        surf.blit(img, (self.rect.x - camx, self.rect.y - camy))
+    def draw(self, surf, camx, camy, alpha=1.0):
+        # lerp between the last two physics steps for smooth motion
+        x = self.prev_x + (self.rect.x - self.prev_x) * alpha
+        y = self.prev_y + (self.rect.y - self.prev_y) * alpha
+        surf.blit(self.image, (int(x) - camx, int(y) - camy))
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Sample level (simple generator → DS-ish 1-1)
 # ──────────────────────────────────────────────────────────────────────────────
 def make_level_w1_1():
+    """Build the map straight into the row-major bytearray TileMap keeps."""
     H = 14  # rows
     W = 160 # cols (≈ 2560 px)
-    rows = [['.' for _ in range(W)] for _ in range(H)]
+    buf = bytearray(b'.' * (W * H))
+
+    def put(tx, ty, ch):
+        buf[ty*W + tx] = ch
 
     # baseline ground
     ground_y = H - 2
     for x in range(W):
-        rows[ground_y][x] = 'P'
-        rows[ground_y+1][x] = 'P'
+        put(x, ground_y, ORD_P)
+        put(x, ground_y+1, ORD_P)
 
     # spawn & early platforms
-    rows[ground_y-1][2] = 'S'
+    put(2, ground_y-1, ORD_S)
     for x in range(10, 20):
-        rows[ground_y-4][x] = '='
+        put(x, ground_y-4, ORD_EQ)
     for x in range(26, 30):
-        rows[ground_y-6][x] = '='
+        put(x, ground_y-6, ORD_EQ)
 
     # small pits
-    for x in range(40, 43):  rows[ground_y][x] = '.'
-    for x in range(41, 43):  rows[ground_y+1][x] = '.'
+    for x in range(40, 43):  put(x, ground_y, ORD_DOT)
+    for x in range(41, 43):  put(x, ground_y+1, ORD_DOT)
 
     # blocks section
     for x in range(55, 60):
-        rows[ground_y-5][x] = '#'
+        put(x, ground_y-5, ORD_HASH)
     for x in range(62, 67):
-        rows[ground_y-3][x] = '#'
+        put(x, ground_y-3, ORD_HASH)
 
     # coin lines
     for x in range(14, 20):
-        rows[ground_y-6][x] = 'C'
+        put(x, ground_y-6, ORD_C)
     for x in range(70, 76):
-        rows[ground_y-7][x] = 'C'
+        put(x, ground_y-7, ORD_C)
 
     # step-up platforms
     for i, x0 in enumerate([84, 88, 92]):
         for x in range(x0, x0+3):
-            rows[ground_y-2-i][x] = '='
+            put(x, ground_y-2-i, ORD_EQ)
 
     # final run and flag
-    rows[ground_y-5][W-20] = 'C'
-    rows[ground_y-6][W-18] = 'C'
-    rows[ground_y-7][W-16] = 'C'
-    rows[ground_y-1][W-6]  = 'F'
+    put(W-20, ground_y-5, ORD_C)
+    put(W-18, ground_y-6, ORD_C)
+    put(W-16, ground_y-7, ORD_C)
+    put(W-6,  ground_y-1, ORD_F)
 
-    return ["".join(r) for r in rows]
+    return buf, W, H
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Game
@@ -567,16 +571,17 @@ def make_level_w1_1():
 class Game:
     def __init__(self):
         pygame.init()
-        flags = 0
+        # SCALED: SDL upscales the 300x200 logical surface on the GPU, so
+        # we draw at internal resolution straight onto the screen.
+        flags = pygame.SCALED
         try:
-            self.screen = pygame.display.set_mode((SCREEN_W, SCREEN_H), flags, vsync=1)
+            self.screen = pygame.display.set_mode((FRAME_W, FRAME_H), flags, vsync=1)
         except TypeError:
             # Older SDL/Pygame without vsync kwarg
-            self.screen = pygame.display.set_mode((SCREEN_W, SCREEN_H), flags)
+            self.screen = pygame.display.set_mode((FRAME_W, FRAME_H), flags)
         pygame.display.set_caption("Samsoft DS Engine — 600x400 @ 60")
 
         self.clock = pygame.time.Clock()
-        self.frame = pygame.Surface((FRAME_W, FRAME_H)).convert()  # offscreen buffer
 
         # World
         self.level = TileMap(make_level_w1_1())
@@ -592,6 +597,8 @@ class Game:
         # State
         self.level_complete = False
         self.fade = 0.0
+        self._shade = pygame.Surface((FRAME_W, FRAME_H))  # fade overlay, reused
+        self._shade.fill((0, 0, 0))
 
     def handle_events(self):
         for e in pygame.event.get():
@@ -607,9 +614,9 @@ class Game:
         self.player.update(keys, self.level, dt)
 
         # coins
-        got = pygame.sprite.spritecollide(self.player, self.level.coins, dokill=True)
+        got = self.level.collect_coins(self.player.rect)
         if got:
-            self.player.coins += len(got)
+            self.player.coins += got
 
         # flag reach
         if self.level.flag_rect and self.player.rect.colliderect(self.level.flag_rect):
@@ -628,40 +635,38 @@ class Game:
         fps = f"{self.clock.get_fps():.0f} FPS"
         t1 = self.font.render(txt, True, WHITE)
         t2 = self.font.render(fps, True, WHITE)
-        self.frame.blit(t1, (6, 6))
-        self.frame.blit(t2, (FRAME_W - t2.get_width() - 6, 6))
+        self.screen.blit(t1, (6, 6))
+        self.screen.blit(t2, (FRAME_W - t2.get_width() - 6, 6))
 
-    def render(self):
-        # draw everything to internal frame
-        self.level.draw(self.frame, self.camx, self.camy)
-        self.player.draw(self.frame, self.camx, self.camy)
+    def render(self, alpha=1.0):
+        # draw at internal resolution; SDL scales on flip
+        self.level.draw(self.screen, self.camx, self.camy)
+        self.player.draw(self.screen, self.camx, self.camy, alpha)
         self.draw_ui()
 
         # simple fade when level complete
         if self.level_complete:
             self.fade = clamp(self.fade + 0.8, 0, 255)
-            shade = pygame.Surface((FRAME_W, FRAME_H))
-            shade.set_alpha(int(self.fade))
-            shade.fill((0, 0, 0))
-            self.frame.blit(shade, (0, 0))
-
-        # scale to window (crisp)
-        scaled = pygame.transform.scale(self.frame, (SCREEN_W, SCREEN_H))
-        self.screen.blit(scaled, (0, 0))
+            self._shade.set_alpha(int(self.fade))
+            self.screen.blit(self._shade, (0, 0))
+
         pygame.display.flip()
-        # clear frame for next draw
-        self.frame.fill((0, 0, 0))
 
     def run(self):
         # Warm-up to stabilize timers
         self.clock.tick(FPS)
+        acc = 0.0
         running = True
         while running:
             running = self.handle_events()
-            dt = self.clock.tick(FPS) / 1000.0
-            dt = min(dt, 1/30)  # clamp for stable physics on hiccups
-            self.update(dt)
-            self.render()
+            acc += self.clock.tick(FPS) / 1000.0
+            if acc > 0.25:
+                acc = 0.25  # don't spiral after a long hiccup
+            # fixed-step physics; leftover time becomes the render lerp
+            while acc >= PHYS_STEP:
+                self.update(PHYS_STEP)
+                acc -= PHYS_STEP
+            self.render(acc / PHYS_STEP)
         pygame.quit()
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -669,64 +674,3 @@ class Game:
 # ──────────────────────────────────────────────────────────────────────────────
 if __name__ == "__main__":
     Game().run()
-
-# ──────────────────────────────────────────────────────────────────────────────
-# Game Class
-# ──────────────────────────────────────────────────────────────────────────────
-class Game:
-    def __init__(self):
-        pygame.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Super Mario Bros")
-        self.clock = pygame.time.Clock()
-        
-        # Create player frames (simple colored rectangles for now)
-        player_frames = [
-            pygame.Surface((TILE_SIZE, TILE_SIZE)),
-            pygame.Surface((TILE_SIZE, TILE_SIZE))
-        ]
-        for frame in player_frames:
-            frame.fill(PLAYER_RED)
-        
-        self.player = Player(player_frames)
-        self.tiles = generate_level(SCREEN_WIDTH // TILE_SIZE, SCREEN_HEIGHT // TILE_SIZE)
-        
-        self.running = True
-        
-    def handle_events(self):
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            self.player.handle_event(event)
-    
-    def update(self, dt):
-        keys = pygame.key.get_pressed()
-        self.player.update(keys, self.tiles, dt)
-    
-    def render(self):
-        self.screen.fill(SKY)
-        
-        # Draw tiles
-        for tile in self.tiles:
-            pygame.draw.rect(self.screen, GROUND, tile)
-        
-        # Draw player
-        self.screen.blit(self.player.image, self.player.rect)
-        
-        pygame.display.flip()
-    
-    def run(self):
-        while self.running:
-            dt = self.clock.tick(FPS) / 1000.0  # Convert to seconds
-            
-            self.handle_events()
-            self.update(dt)
-            self.render()
-        
-        pygame.quit()
-
-def main():
-    Game().run()
-
-if __name__ == "__main__":
-    main()